@@ -94,9 +94,9 @@ class AgentBridge:
 
     def _worker_loop(self):
         print("🔧 AgentBridge worker loop started")
-        last_mc_poll      = time.time()
-        last_auto_tick    = time.time()
-        last_context_check = time.time()
+        last_mc_poll      = time.monotonic()
+        last_auto_tick    = time.monotonic()
+        last_context_check = time.monotonic()
 
         # Load config values (with safe fallbacks)
         try:
@@ -114,10 +114,10 @@ class AgentBridge:
             _auto_default = 30.0
 
         def _time_until_next(interval: float, last_time: float, min_wait: float = 0.25) -> float:
-            return max(min_wait, interval - (time.time() - last_time))
+            return max(min_wait, interval - (time.monotonic() - last_time))
 
         while not self._stop_event.is_set():
-            now = time.time()
+            now = time.monotonic()
             mc_chat_interval = _poll_mc if self._mc_detected else _poll_idle
             ctx_interval = _poll_mc if (self._mc_detected or self._mc_bridge) else _poll_idle
             auto_interval = _auto_mc if self._mc_detected else _auto_default
@@ -131,7 +131,7 @@ class AgentBridge:
             try:
                 item = self._q.get(timeout=next_timeout)
             except queue.Empty:
-                now = time.time()
+                now = time.monotonic()
 
                 # ── Periodic MC process detection (cheap psutil scan) ──────
                 if now - self._last_mc_detect > _mc_detect:
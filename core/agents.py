@@ -489,7 +489,7 @@ class agents:
         if not text:
             return
 
-        now = time.time()
+        now = time.monotonic()
         try:
             from core.config import (
                 LLM_FAILURE_COOLDOWN,
@@ -564,7 +564,7 @@ class agents:
                 )
                 cooldown = max(0.0, LLM_FAILURE_COOLDOWN) * cooldown_multiplier
                 if retryable and cooldown:
-                    self._desktop_llm_cooldown_until = time.time() + cooldown
+                    self._desktop_llm_cooldown_until = time.monotonic() + cooldown
                     logger.warning(
                         "Desktop STT entering LLM cooldown for %.1fs after repeated failures",
                         cooldown,
@@ -754,7 +754,7 @@ class agents:
                 from core.config import TAB_RATE_LIMIT_SECONDS
             except Exception:
                 TAB_RATE_LIMIT_SECONDS = 30.0
-            now = time.time()
+            now = time.monotonic()
             if now - self._last_tab_open_time < TAB_RATE_LIMIT_SECONDS:
                 logger.debug("openApp rate-limited: %s", app)
                 return False
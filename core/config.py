@@ -25,6 +25,10 @@ POLL_INTERVAL_IDLE = float(os.environ.get("DPETML_POLL_IDLE", "10.0"))
 # … actively using a non-game app
 POLL_INTERVAL_ACTIVE = float(os.environ.get("DPETML_POLL_ACTIVE", "5.0"))
 
+# Ceiling for the app-tracking poll while the same app stays focused; the
+# idle interval doubles on each unchanged poll until it reaches this.
+POLL_INTERVAL_MAX = float(os.environ.get("DPETML_POLL_MAX", "30.0"))
+
 # … with Minecraft detected / bridge active
 POLL_INTERVAL_MINECRAFT = float(os.environ.get("DPETML_POLL_MC", "2.0"))
 
@@ -77,6 +81,10 @@ STT_DEBOUNCE_SECONDS = float(os.environ.get("DPETML_STT_DEBOUNCE", "2.5"))
 LLM_PROVIDER = os.environ.get("DPETML_LLM_PROVIDER", "gemini").strip().lower()
 LLM_MODEL = os.environ.get("DPETML_LLM_MODEL", "").strip()
 GEMINI_API_KEY = os.environ.get("DPETML_GEMINI_API_KEY", "").strip()
+# How long Ollama keeps the model (and its prompt cache) loaded between calls.
+# The messenger and agents call every few minutes; Ollama's own default of 5m
+# lets the model unload in between and every call pays the reload + prefill.
+LLM_KEEP_ALIVE = os.environ.get("DPETML_LLM_KEEP_ALIVE", "30m").strip()
 
 # UI startup mode
 # auto: terminal => TUI, otherwise GUI
@@ -103,8 +111,9 @@ MCP_TIMEOUT = float(os.environ.get("DPETML_MCP_TIMEOUT", "10.0"))
 # Optional int8 / reduced-precision quantization
 #
 # scikit-learn's IsolationForest does not support true int8 quantization.
-# When this flag is enabled the tracker converts numpy feature arrays to
-# float32 (halving memory vs float64) before training and inference.
+# The tracker now always builds float32 feature arrays, so this flag no
+# longer changes anything there; it is still parsed so existing
+# DPETML_INT8 settings keep working.
 # Full ONNX / torch int8 quantization is reserved for future work when
 # the model stack supports it.
 # ---------------------------------------------------------------------------
@@ -112,6 +121,13 @@ ENABLE_INT8_QUANTIZATION = os.environ.get("DPETML_INT8", "0").lower() in (
     "1", "true", "yes"
 )
 
+# ---------------------------------------------------------------------------
+# Anomaly-model training window
+# Retraining only looks at the most recent N sessions so fit time stays flat
+# as history grows; the full history stays in the database.  0 = no limit.
+# ---------------------------------------------------------------------------
+TRAINING_WINDOW = int(os.environ.get("DPETML_TRAIN_WINDOW", "5000"))
+
 # ---------------------------------------------------------------------------
 # Browser / app tab rate-limit
 # Minimum seconds that must elapse between successive OPEN_APP / OPEN_TAB
@@ -125,6 +141,7 @@ TAB_RATE_LIMIT_SECONDS = float(os.environ.get("DPETML_TAB_RATE", "30.0"))
 if QUIET_MODE:
     POLL_INTERVAL_IDLE *= 2
     POLL_INTERVAL_ACTIVE *= 2
+    POLL_INTERVAL_MAX *= 2
     POLL_INTERVAL_MINECRAFT *= 2
     AUTONOMOUS_INTERVAL_DEFAULT *= 2
     AUTONOMOUS_INTERVAL_MINECRAFT *= 2
@@ -7,6 +7,7 @@ import sqlite3
 import threading
 import os
 import sys
+from contextlib import contextmanager
 
 
 def get_base_dir():
@@ -29,12 +30,32 @@ class Memory:
 
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
-        self.lock = threading.Lock()
+        # Re-entrant: the write methods hold it around _connect(), which takes it too
+        self.lock = threading.RLock()
+        # One connection for the life of the instance, shared by the worker
+        # and GUI threads; every use goes through self.lock.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL makes each commit an append instead of a rollback-journal
+        # rewrite; NORMAL skips the per-commit fsync that WAL doesn't need.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache, kept warm by the shared connection
         self._init_db()
 
+    @contextmanager
+    def _connect(self):
+        """Lock the shared connection for one transaction (commit on success)."""
+        with self.lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        with self.lock:
+            self._conn.close()
+
     def _init_db(self):
         """Create tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
 
             # App categories cache
@@ -92,7 +113,7 @@ class Memory:
 
     def get_all_categories(self) -> dict:
         """Load all app->category mappings"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
             c.execute("SELECT app_name, category FROM app_categories")
             return {app: cat for app, cat in c.fetchall()}
@@ -100,7 +121,7 @@ class Memory:
     def save_category(self, app_name: str, category: str):
         """Save a single app category"""
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 c = conn.cursor()
                 c.execute('''
                     INSERT OR REPLACE INTO app_categories (app_name, category)
@@ -108,9 +129,20 @@ class Memory:
                 ''', (app_name, category))
                 conn.commit()
 
+    def save_categories_bulk(self, pairs: list):
+        """Save multiple (app_name, category) pairs at once"""
+        with self.lock:
+            with self._connect() as conn:
+                c = conn.cursor()
+                c.executemany('''
+                    INSERT OR REPLACE INTO app_categories (app_name, category)
+                    VALUES (?, ?)
+                ''', pairs)
+                conn.commit()
+
     def get_category(self, app_name: str) -> str:
         """Get category for an app (returns 'unknown' if not found)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
             c.execute("SELECT category FROM app_categories WHERE app_name = ?", (app_name,))
             result = c.fetchone()
@@ -122,7 +154,7 @@ class Memory:
 
     def get_all_sessions(self) -> list:
         """Load all session records"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
             c.execute('''
                       SELECT app, category, start_time, end_time, duration_seconds
@@ -141,6 +173,28 @@ class Memory:
                 for app, cat, start, end, dur in c.fetchall()
             ]
 
+    def get_session_columns(self, limit=None) -> dict:
+        """
+        Load the training columns of the last `limit` sessions (all if None)
+        column-wise, oldest first:
+        {'startTime': (...), 'durationSeconds': (...), 'category': (...)}
+        """
+        with self._connect() as conn:
+            c = conn.cursor()
+            c.execute('''
+                      SELECT start_time, duration_seconds, category
+                      FROM (SELECT id, start_time, duration_seconds, category
+                            FROM sessions
+                            ORDER BY id DESC LIMIT ?)
+                      ORDER BY id
+                      ''', (limit if limit else -1,))
+            starts, durations, categories = list(zip(*c.fetchall())) or ((), (), ())
+            return {
+                'startTime': starts,
+                'durationSeconds': durations,
+                'category': categories
+            }
+
     def save_session(self, session: dict):
         """
         Save a single session
@@ -153,7 +207,7 @@ class Memory:
         }
         """
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 c = conn.cursor()
                 c.execute('''
                           INSERT INTO sessions (app, category, start_time, end_time, duration_seconds)
@@ -170,7 +224,7 @@ class Memory:
     def save_sessions_bulk(self, sessions: list):
         """Save multiple sessions at once (faster)"""
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 c = conn.cursor()
                 c.executemany('''
                               INSERT INTO sessions (app, category, start_time, end_time, duration_seconds)
@@ -183,7 +237,7 @@ class Memory:
 
     def get_recent_sessions(self, limit=50) -> list:
         """Get last N sessions"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
             c.execute('''
                       SELECT app, category, start_time, end_time, duration_seconds
@@ -208,14 +262,14 @@ class Memory:
 
     def get_session_count(self) -> int:
         """Total number of sessions"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
             c.execute("SELECT COUNT(*) FROM sessions")
             return c.fetchone()[0]
 
     def get_stats_by_category(self) -> dict:
         """Get usage stats grouped by category"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             c = conn.cursor()
             c.execute('''
                       SELECT category,
@@ -1,3 +1,4 @@
+import itertools
 import threading
 import time
 import random
@@ -93,6 +94,10 @@ MINECRAFT_MOOD_LINES = {
 }
 
 
+# Last-resort line when a mood has no pool at all (shared, never mutated)
+_FALLBACK_LINES = ("...",)
+
+
 class GUIProxy:
     def __init__(self, show_callback: Optional[Callable[[str], None]] = None):
         self._cb = show_callback
@@ -172,6 +177,10 @@ class RandomMessenger(threading.Thread):
             self.llm = None
 
         self._jitter = lambda: random.uniform(-0.25, 0.25) * self.interval
+        # One shuffled cycle per line pool, so lines don't repeat until the
+        # pool is used up
+        self._line_cycles = {}
+        self._personality_sys = None
 
     def stop(self):
         self._stop.set()
@@ -217,13 +226,27 @@ class RandomMessenger(threading.Thread):
             mc_active = False
         return MINECRAFT_MOOD_LINES if mc_active else self.mood_lines
 
+    def _next_line(self, lines) -> str:
+        cycle = self._line_cycles.get(id(lines))
+        if cycle is None:
+            cycle = itertools.cycle(random.sample(lines, len(lines)))
+            self._line_cycles[id(lines)] = cycle
+        return next(cycle)
+
+    def _personality_prompt(self) -> str:
+        # Read once: an identical system prompt every call also lets Ollama
+        # reuse the cached prefix instead of re-processing it.
+        if self._personality_sys is None:
+            try:
+                with open("llm/prompts/personality.txt", "r", encoding="utf-8") as f:
+                    self._personality_sys = f.read()
+            except Exception:
+                self._personality_sys = "You are a sassy desktop cat companion. Make short, witty observations about what your human is doing."
+        return self._personality_sys
+
     def _build_prompt(self, mood: str, context_summary: str) -> list:
         """Construct chat prompt for LLM with app context"""
-        try:
-            with open("llm/prompts/personality.txt", "r", encoding="utf-8") as f:
-                personality_sys = f.read()
-        except Exception:
-            personality_sys = "You are a sassy desktop cat companion. Make short, witty observations about what your human is doing."
+        personality_sys = self._personality_prompt()
 
         # Extract current app from context if available
         current_app = self.pet._activeApp if self.pet._activeApp != "Unknown" else None
@@ -356,8 +379,8 @@ class RandomMessenger(threading.Thread):
                     active_lines = self._get_active_mood_lines()
                     _mc_pool = active_lines.get(mood)
                     _default_pool = self.mood_lines.get(mood)
-                    lines = _mc_pool if _mc_pool is not None else (_default_pool if _default_pool is not None else ["..."])
-                    text = random.choice(lines)
+                    lines = _mc_pool if _mc_pool is not None else (_default_pool if _default_pool is not None else _FALLBACK_LINES)
+                    text = self._next_line(lines)
                     print(f"🔔 Messenger fallback: {text}")
                     if callable(self.show_cb):
                         self.show_cb(text)
@@ -26,7 +26,9 @@ class PersonalityEngine:
         self.gui = gui
         self.mood_lines = mood_lines
         self.isTalking = False
-        self.last_act_time = time.time()
+        self.last_act_time = time.monotonic()
+        # Roll the next act delay once per act instead of on every call
+        self._next_act_time = self.last_act_time + random.randint(2, 6)
 
     def random_act(self, context):
         # Decide action based on personality, context
@@ -48,20 +50,23 @@ class PersonalityEngine:
         return action
 
     def act(self, context, scarpet_bridge):
-        # Every few seconds, decide something to do
-        now = time.time()
-        if now - self.last_act_time > random.randint(2, 6):
-            action = self.random_act(context)
-            self.last_act_time = now
-            # You can expand these with more personality!
-            if action == "wander":
-                scarpet_bridge.send_scarpet_command('petbot_wander()')
-            elif action == "look_at_player":
-                scarpet_bridge.send_scarpet_command('petbot_look_at_player()')
-            elif action == "punch_player":
-                scarpet_bridge.send_scarpet_command('petbot_punch_player()')
-            elif action == "follow_player":
-                scarpet_bridge.send_scarpet_command('petbot_follow_player()')
-            else:
-                # Do nothing or idle animation
-                pass
\ No newline at end of file
+        # Every few seconds, decide something to do.
+        # Most calls land here, so bail out with a single comparison.
+        now = time.monotonic()
+        if now < self._next_act_time:
+            return
+        action = self.random_act(context)
+        self.last_act_time = now
+        self._next_act_time = now + random.randint(2, 6)
+        # You can expand these with more personality!
+        if action == "wander":
+            scarpet_bridge.send_scarpet_command('petbot_wander()')
+        elif action == "look_at_player":
+            scarpet_bridge.send_scarpet_command('petbot_look_at_player()')
+        elif action == "punch_player":
+            scarpet_bridge.send_scarpet_command('petbot_punch_player()')
+        elif action == "follow_player":
+            scarpet_bridge.send_scarpet_command('petbot_follow_player()')
+        else:
+            # Do nothing or idle animation
+            pass
\ No newline at end of file
@@ -59,7 +59,25 @@ def get_active_window_title() -> Optional[str]:
         return None
 
 
+if sys.platform == "win32":
+    import ctypes
+    _user32 = ctypes.windll.user32
+else:
+    _user32 = None
+
+
 def _get_title_windows() -> Optional[str]:
+    # Two user32 calls straight through ctypes; pygetwindow builds a
+    # Win32Window wrapper (and its own title lookup) on every poll.
+    try:
+        hwnd = _user32.GetForegroundWindow()
+        if not hwnd:
+            return None
+        buf = ctypes.create_unicode_buffer(512)
+        _user32.GetWindowTextW(hwnd, buf, len(buf))
+        return buf.value or None
+    except Exception:
+        pass
     try:
         import pygetwindow as gw
         w = gw.getActiveWindow()
@@ -42,13 +42,20 @@ class ShortTermMemory:
         return list(reversed(visions[:limit]))
 
     def add_app_activity(self, app: str, category: str, surprised: bool = False, curious: bool = False):
-        """Store app activity event"""
-        self.add("app_activity", {
+        """Store app activity event (a repeat of the latest event just refreshes it)"""
+        data = {
             "app": app,
             "category": category,
             "surprised": surprised,
             "curious": curious
-        })
+        }
+        # The worker reports the same state every poll; collapse runs so
+        # they don't push chats and visions out of the bounded deque.
+        last = self.events[-1] if self.events else None
+        if last and last["type"] == "app_activity" and last["data"] == data:
+            last["timestamp"] = time.time()
+            return
+        self.add("app_activity", data)
 
     def get_recent_app_activities(self, seconds: int = 300, limit: int = 5) -> List[Dict]:
         """Get recent app activities"""
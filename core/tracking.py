@@ -1,9 +1,12 @@
+import hashlib
 import time
 from datetime import datetime
+import numpy as np
 from sklearn.ensemble import IsolationForest
 import joblib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import core.memory
 from core.platform_utils import get_data_dir
 
@@ -22,23 +25,113 @@ BASE_DIR = get_base_dir()
 MODEL_DIR = os.path.join(get_data_dir(), "models")
 
 
-def _numpy_dtype():
+_SESSION_COLUMNS = ('startTime', 'durationSeconds', 'category')
+
+
+def _session_columns(history) -> dict:
+    """Accept either Memory.get_session_columns() output or a list of session dicts."""
+    if isinstance(history, dict):
+        return history
+    return {key: [s[key] for s in history] for key in _SESSION_COLUMNS}
+
+
+def _session_features(columns: dict, category_map: dict):
     """
-    Return the numpy dtype to use for feature arrays.
+    Build the (duration, category) and (start_hour, category) feature arrays
+    for a whole history in one go instead of one fromisoformat() per session.
+    Raises on any malformed record so the caller can fall back to the
+    per-session loop.
+    Arrays are float32, the dtype IsolationForest converts its input to anyway.
+    """
+    starts = np.array(columns['startTime'], dtype='datetime64[us]')
+    minutes = starts.astype('datetime64[m]')
+    # Minutes since midnight / 60 == hour + minute / 60
+    start_hour = (minutes - minutes.astype('datetime64[D]')).astype(np.float32) / 60
+    duration = np.asarray(columns['durationSeconds'], dtype=np.float32) / 60
+    category_id = np.array([category_map[c] for c in columns['category']], dtype=np.float32)
+
+    return (np.column_stack((duration, category_id)),
+            np.column_stack((start_hour, category_id)))
 
-    When ENABLE_INT8_QUANTIZATION is True the tracker uses float32 instead
-    of the default float64, halving the memory footprint of feature arrays.
-    scikit-learn IsolationForest does not support int8 natively, so float32
-    is the practical minimum-precision option for this stack.
+
+def _fit_models(history, category_map=None, last_fit_hash=None):
+    """
+    Fit the duration and time-habit forests on session history.
+    Touches no tracker state, so it can run on a worker thread.
+    category_map is extended (never renumbered), so ids stay stable
+    across retrains.
+    Returns (categoryMap, durationModel, timeHabitModel, fit_hash), or None
+    if there isn't enough usable data or the features hash to
+    last_fit_hash (the current models were fit on exactly this data).
+
+    Feature arrays are always float32, the dtype IsolationForest works in,
+    so fit() doesn't make a converted copy.
     """
+    columns = _session_columns(history)
+    count = len(columns['startTime'])
+    if count < 10:
+        print("⚠️ Need at least 10 sessions to train")
+        return None
+
+    print(f"Training on {count} sessions...")
+
+    # Extend the category map with any categories it hasn't seen
+    category_map = dict(category_map or {})
+    for cat in set(columns['category']).difference(category_map):
+        category_map[cat] = len(category_map)
+
+    # Extract features
     try:
-        from core.config import ENABLE_INT8_QUANTIZATION
-        if ENABLE_INT8_QUANTIZATION:
-            import numpy as np
-            return np.float32
+        duration_data, time_data = _session_features(columns, category_map)
     except Exception:
-        pass
-    return None  # let numpy/sklearn pick the default (float64)
+        # Something in the history doesn't parse; go record by record
+        # so only the bad sessions get skipped.
+        duration_data = []
+        time_data = []
+
+        for start_time, duration_seconds, category in zip(*(columns[k] for k in _SESSION_COLUMNS)):
+            try:
+                start = datetime.fromisoformat(start_time)
+                duration = duration_seconds / 60
+                start_hour = start.hour + start.minute / 60
+                category_id = category_map.get(category, -1)
+
+                if category_id != -1:
+                    duration_data.append([duration, category_id])
+                    time_data.append([start_hour, category_id])
+            except Exception as e:
+                print(f"Skipping bad session: {e}")
+                continue
+
+    if not len(duration_data) or not len(time_data):
+        print("No valid training data")
+        return None
+
+    # The per-session fallback builds lists; match the vectorised float32
+    # arrays (np.asarray is a no-op for those) so the fit hash is comparable.
+    duration_data = np.asarray(duration_data, dtype=np.float32)
+    time_data = np.asarray(time_data, dtype=np.float32)
+
+    fit_hash = hashlib.blake2b(
+        np.ascontiguousarray(duration_data).tobytes() + np.ascontiguousarray(time_data).tobytes(),
+        digest_size=16,
+    ).hexdigest()
+    if fit_hash == last_fit_hash:
+        print("✓ History unchanged since last training, keeping current models")
+        return None
+
+    # Train models; trees are built on all cores (we're already off the
+    # tracking loop). Predict is one row per app switch, where spinning up
+    # a thread pool costs more than it saves, so drop back to serial after.
+    duration_model = IsolationForest(contamination=0.1, random_state=42, n_jobs=-1)
+    time_model = IsolationForest(contamination=0.1, random_state=42, n_jobs=-1)
+
+    duration_model.fit(duration_data)
+    time_model.fit(time_data)
+    duration_model.set_params(n_jobs=None)
+    time_model.set_params(n_jobs=None)
+
+    return category_map, duration_model, time_model, fit_hash
 
 
 class AppTracker:
@@ -58,6 +151,12 @@ class AppTracker:
         self.categoryMap = {}
         self._models_missing_reported = False
         self._models_not_trained_reported = False
+        # Digest of the features the current models were fit on
+        self._fit_hash = None
+
+        # Background retraining (train_in_background / collect_training)
+        self._train_executor = None
+        self._train_future = None
 
         # Prediction results
         self.surprised = False  # Unusual duration
@@ -85,9 +184,12 @@ class AppTracker:
                 'durationSeconds': duration
             }
 
-        # Start tracking new app
-        self.activeApp = app_name
-        self.startTime = now
+        # Start tracking the new app. Polls that see the same app keep the
+        # original startTime, so a session's duration doesn't depend on how
+        # long the worker slept before noticing the switch.
+        if self.activeApp != app_name or not self.startTime:
+            self.activeApp = app_name
+            self.startTime = now
 
         return session_data
 
@@ -120,11 +222,11 @@ class AppTracker:
                 return
 
             # Predict duration outlier
-            dur_input = [[duration, category_id]]
+            dur_input = np.array([[duration, category_id]], dtype=np.float32)
             dur_outlier = self.durationModel.predict(dur_input)[0]
 
             # Predict time outlier
-            time_input = [[start_hour, category_id]]
+            time_input = np.array([[start_hour, category_id]], dtype=np.float32)
             time_outlier = self.timeHabitModel.predict(time_input)[0]
 
             # Set flags
@@ -139,67 +241,57 @@ class AppTracker:
         except Exception as e:
             print(f"Prediction error: {e}")
 
-    def train_on_history(self, history: list):
+    def train_on_history(self, history):
         """
-        Train models on session history.
-        history = [{'startTime': '...', 'durationSeconds': 123, 'category': 'gaming'}, ...]
-
-        When ENABLE_INT8_QUANTIZATION is set in config, feature arrays are
-        stored as float32 instead of float64 to halve memory usage.
+        Train models on session history, blocking until done.
+        history = Memory.get_session_columns() output, or
+                  [{'startTime': '...', 'durationSeconds': 123, 'category': 'gaming'}, ...]
         """
-        if len(history) < 10:
-            print("⚠️ Need at least 10 sessions to train")
+        trained = _fit_models(history, self.categoryMap, self._fit_hash)
+        if trained is None:
             return False
+        self._apply_trained(trained)
+        return True
 
-        print(f"Training on {len(history)} sessions...")
-
-        # Build category map
-        categories = list({s['category'] for s in history})
-        self.categoryMap = {cat: idx for idx, cat in enumerate(categories)}
-
-        # Extract features
-        duration_data = []
-        time_data = []
-
-        for session in history:
-            try:
-                start = datetime.fromisoformat(session['startTime'])
-                duration = session['durationSeconds'] / 60
-                start_hour = start.hour + start.minute / 60
-                category_id = self.categoryMap.get(session['category'], -1)
-
-                if category_id != -1:
-                    duration_data.append([duration, category_id])
-                    time_data.append([start_hour, category_id])
-            except Exception as e:
-                print(f"Skipping bad session: {e}")
-                continue
-
-        if not duration_data or not time_data:
-            print("No valid training data")
+    def train_in_background(self, history) -> bool:
+        """
+        Start training on a worker thread; call collect_training() later to
+        swap the new models in. Returns False if a run is still in progress.
+        """
+        if self._train_future is not None and not self._train_future.done():
             return False
+        if self._train_executor is None:
+            self._train_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-train")
+        self._train_future = self._train_executor.submit(
+            _fit_models, history, dict(self.categoryMap), self._fit_hash)
+        return True
 
-        # Optionally reduce precision to float32 to save memory
-        dtype = _numpy_dtype()
-        if dtype is not None:
-            try:
-                import numpy as np
-                # Use np.asarray to avoid an unnecessary copy if already an array
-                duration_data = np.asarray(duration_data, dtype=dtype)
-                time_data = np.asarray(time_data, dtype=dtype)
-            except Exception:
-                pass  # fall back to default dtype if numpy conversion fails
-
-        # Train models
-        self.durationModel = IsolationForest(contamination=0.1, random_state=42)
-        self.timeHabitModel = IsolationForest(contamination=0.1, random_state=42)
+    def collect_training(self) -> bool:
+        """Swap in models from a finished background run. True if new models were applied."""
+        future = self._train_future
+        if future is None or not future.done():
+            return False
+        self._train_future = None
+        try:
+            trained = future.result()
+        except Exception as e:
+            print(f"Training failed: {e}")
+            return False
+        if trained is None:
+            return False
+        self._apply_trained(trained)
+        return True
 
-        self.durationModel.fit(duration_data)
-        self.timeHabitModel.fit(time_data)
+    def shutdown(self):
+        if self._train_executor is not None:
+            self._train_executor.shutdown(wait=False, cancel_futures=True)
+            self._train_executor = None
 
+    def _apply_trained(self, trained):
+        self.categoryMap, self.durationModel, self.timeHabitModel, self._fit_hash = trained
+        self._models_not_trained_reported = False
         self.save_models()
         print(f"✓ Models trained! Categories: {list(self.categoryMap.keys())}")
-        return True
 
     def save_models(self, prefix='pet_model'):
         """Save trained models to disk"""
@@ -210,6 +302,7 @@ class AppTracker:
             joblib.dump(self.durationModel, os.path.join(MODEL_DIR, f'{prefix}_duration.joblib'))
             joblib.dump(self.timeHabitModel, os.path.join(MODEL_DIR, f'{prefix}_time.joblib'))
             joblib.dump(self.categoryMap, os.path.join(MODEL_DIR, f'{prefix}_categories.joblib'))
+            joblib.dump(self._fit_hash, os.path.join(MODEL_DIR, f'{prefix}_fit_hash.joblib'))
             print("✓ Models saved")
         except Exception as e:
             print(f"Model save failed: {e}")
@@ -220,6 +313,10 @@ class AppTracker:
             self.durationModel = joblib.load(os.path.join(MODEL_DIR, f'{prefix}_duration.joblib'))
             self.timeHabitModel = joblib.load(os.path.join(MODEL_DIR, f'{prefix}_time.joblib'))
             self.categoryMap = joblib.load(os.path.join(MODEL_DIR, f'{prefix}_categories.joblib'))
+            try:
+                self._fit_hash = joblib.load(os.path.join(MODEL_DIR, f'{prefix}_fit_hash.joblib'))
+            except Exception:
+                self._fit_hash = None  # models saved before the hash existed
             print("✓ Models loaded")
             self._models_missing_reported = False
             self._models_not_trained_reported = False
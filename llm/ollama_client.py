@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 try:
     import ollama
 except Exception:
@@ -19,18 +20,25 @@ class LLMClient:
                 LLM_PROVIDER,
                 LLM_MODEL,
                 GEMINI_API_KEY,
+                LLM_KEEP_ALIVE,
             )
             timeout = float(LLM_TIMEOUT) if LLM_TIMEOUT is not None and LLM_TIMEOUT > 0 else None
             configured_provider = (LLM_PROVIDER or "gemini").lower()
             configured_model = LLM_MODEL or ""
             self.gemini_key = GEMINI_API_KEY
+            self.keep_alive = LLM_KEEP_ALIVE or None
         except Exception:
             timeout = 30.0
             configured_provider = "gemini"
             configured_model = ""
             self.gemini_key = ""
+            self.keep_alive = None
 
         self.timeout = timeout
+        # Reuse one keep-alive connection pool for Gemini calls instead of
+        # a fresh TCP+TLS handshake per request.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0))
         self.provider = configured_provider
         self.model_name = model_name or configured_model
 
@@ -75,6 +83,7 @@ class LLMClient:
         response = self._ollama.chat(
             model=self.model_name,
             messages=messages,
+            keep_alive=self.keep_alive,
         )
         return response["message"]["content"]
 
@@ -91,7 +100,7 @@ class LLMClient:
         body = {
             "contents": contents or [{"role": "user", "parts": [{"text": ""}]}]
         }
-        resp = requests.post(url, headers=headers, params=params, json=body, timeout=self.timeout or 30.0)
+        resp = self._session.post(url, headers=headers, params=params, json=body, timeout=self.timeout or 30.0)
         resp.raise_for_status()
         data = resp.json()
         try:
@@ -4,50 +4,159 @@ HTTP bridge with distance-based movement and context optimization.
 Sends only changed context values (diffs) instead of full state.
 """
 
+import itertools
 import json
 import logging
+import socket
+import sys
 import threading
 import time
-import uuid
 from collections import deque
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+
+# Optional: orjson encodes/decodes the large /context payloads in C.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Optional: msgpack bodies on /context drop the repeated JSON field names.
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
+__all__ = ["MinecraftBridge", "get_context"]
 
 logger = logging.getLogger(__name__)
 
 # Bound the command queue so it cannot grow without limit if Scarpet stops polling.
 _pending: deque = deque(maxlen=100)
+# _pending is never rebound, so its bound methods can be cached once for the
+# per-command hot paths. (_chat_queue is swapped on drain, so it can't be.)
+_push_cmd = _pending.append
+_pop_cmd = _pending.popleft
+# The server is threaded, so two /commands polls can drain at once. Held over
+# a drain's length checks and pops (both lanes) so neither can popleft an
+# emptied deque, and over the full-queue drop + append in
+# _push_with_backpressure so the command it forgets is the one it evicted.
+_queue_lock = threading.Lock()
+
+# Outgoing bot chat gets its own low-priority lane so a burst of messages
+# can't push move/attack commands to the back of a /commands batch.
+_chat_out: deque = deque(maxlen=100)
+_push_chat_out = _chat_out.append
+_pop_chat_out = _chat_out.popleft
+_COMMAND_BATCH = 10
+_CONTROL_SLOTS = 8  # per batch; chat gets the remaining slots (at least 2)
+# Command ids only need to be unique within this process: a C-level counter
+# is far cheaper than uuid4 and can't collide the way a truncated uuid can.
+_id_counter = itertools.count(1)
 _results: Dict[str, Any] = {}
 _results_lock = threading.Lock()
-_result_events: Dict[str, threading.Event] = {}
+# One condition for every waiter: wait_for() tracks a monotonic deadline, and
+# there is no per-command Event to allocate.
+_results_cond = threading.Condition(_results_lock)
+# cmd_id -> monotonic enqueue time. Doubles as the set of ids still awaiting a
+# result (post_results ignores anything else) and feeds the janitor.
+_enqueue_time: Dict[str, float] = {}
+# What _wait_result hands back when backpressure evicted the command before
+# Scarpet fetched it; reads like a failed result, compare by identity.
+_DROPPED: Dict[str, Any] = {"ok": False, "dropped": True}
+
+# How often the janitor sweeps result bookkeeping that nobody waited on
+# (e.g. /inject commands), and how long an entry may live, in bridge timeouts.
+_JANITOR_INTERVAL = 60.0
+_JANITOR_MAX_AGE_FACTOR = 4
 
 _latest_context: Dict = {}
 _context_lock = threading.Lock()
-_previous_context: Dict = {}  # Track changes for diff optimization
 
 # Bound the chat queue to avoid unbounded growth during LLM/network hiccups.
-_chat_queue: deque = deque(maxlen=200)
+_CHAT_QUEUE_MAX = 200
+_chat_queue: deque = deque(maxlen=_CHAT_QUEUE_MAX)
 _chat_lock = threading.Lock()
 
 
+def _next_id() -> str:
+    return str(next(_id_counter))
+
+
+def _push_with_backpressure(cmd: dict):
+    """
+    Append to the bounded command queue. When it is full, drop the oldest
+    command ourselves, log it and release its waiter right away rather than
+    letting it sit out the full timeout.
+    """
+    dropped = None
+    with _queue_lock:
+        if len(_pending) >= _pending.maxlen:
+            dropped = _pop_cmd()
+        _push_cmd(cmd)
+    if dropped is not None:
+        logger.warning(f"Command queue full, dropping oldest: {dropped.get('action')}")
+        with _results_cond:
+            _forget(dropped.get("id"))
+            _results_cond.notify_all()
+
+
 def _enqueue(cmd: dict) -> str:
-    cmd_id = str(uuid.uuid4())[:8]
+    cmd_id = _next_id()
     cmd["id"] = cmd_id
-    _pending.append(cmd)
-    _result_events[cmd_id] = threading.Event()
+    # Register the id before the command becomes visible to Scarpet so a
+    # fast result can't arrive for an id we don't know yet.
+    with _results_lock:
+        _enqueue_time[cmd_id] = time.monotonic()
+    _push_with_backpressure(cmd)
     return cmd_id
 
 
+def _forget(cmd_id: str):
+    """Drop every bookkeeping entry for a command. Caller holds _results_lock."""
+    _results.pop(cmd_id, None)
+    _enqueue_time.pop(cmd_id, None)
+
+
 def _wait_result(cmd_id: str, timeout: float = 5.0) -> Optional[Any]:
-    event = _result_events.get(cmd_id)
-    result = None
-    if event and event.wait(timeout):
-        with _results_lock:
-            result = _results.pop(cmd_id, None)
-    # Always clean up the event entry to prevent memory leak
-    _result_events.pop(cmd_id, None)
-    return result
+    with _results_cond:
+        try:
+            _results_cond.wait_for(lambda: cmd_id in _results or cmd_id not in _enqueue_time, timeout)
+            if cmd_id in _results:
+                return _results.pop(cmd_id)
+            # An id leaving _enqueue_time without a result means the command was dropped.
+            return None if cmd_id in _enqueue_time else _DROPPED
+        finally:
+            # Always clean up, including a late result or an abandoned id
+            _forget(cmd_id)
+
+
+def _sweep_stale(max_age: float) -> int:
+    """Forget commands older than max_age seconds that nobody collected."""
+    cutoff = time.monotonic() - max_age
+    with _results_lock:
+        stale = [cmd_id for cmd_id, t in _enqueue_time.items() if t < cutoff]
+        for cmd_id in stale:
+            _forget(cmd_id)
+    return len(stale)
+
+
+def _janitor_loop(max_age: float):
+    while True:
+        time.sleep(_JANITOR_INTERVAL)
+        dropped = _sweep_stale(max_age)
+        if dropped:
+            logger.debug(f"Janitor dropped {dropped} stale command result(s)")
+
+
+def _drain_chat() -> list:
+    """Take every queued chat message, holding the lock only for a swap."""
+    global _chat_queue
+    with _chat_lock:
+        drained, _chat_queue = _chat_queue, deque(maxlen=_CHAT_QUEUE_MAX)
+    return list(drained)
 
 
 def get_context() -> dict:
@@ -56,20 +165,21 @@ def get_context() -> dict:
         return dict(_latest_context)
 
 
-def _context_diff(new_context: dict) -> dict:
-    """
-    Compare new context with previous and return only changed values.
-    Reduces HTTP payload significantly.
-    """
-    global _previous_context
+def _json_response(payload) -> Response:
+    """Serialize payload with orjson when available, else fall back to jsonify."""
+    if _orjson is None:
+        return jsonify(payload)
+    return Response(_orjson.dumps(payload), mimetype="application/json")
 
-    diff = {}
-    for key, value in new_context.items():
-        if key not in _previous_context or _previous_context[key] != value:
-            diff[key] = value
 
-    _previous_context = dict(new_context)
-    return diff
+def _request_json(default):
+    """Parse the request body like get_json(force=True, silent=True)."""
+    if _orjson is None:
+        return request.get_json(force=True, silent=True) or default
+    try:
+        return _orjson.loads(request.get_data()) or default
+    except _orjson.JSONDecodeError:
+        return default
 
 
 _app = Flask(__name__)
@@ -78,13 +188,14 @@ _app = Flask(__name__)
 @_app.route("/commands", methods=["GET"])
 def get_commands():
     """Scarpet polls here to fetch command queue."""
-    batch = []
-    for _ in range(10):
-        if _pending:
-            batch.append(_pending.popleft())
-        else:
-            break
-    return jsonify(batch)
+    # Control commands go first; chat fills what's left.
+    pop, pop_chat = _pop_cmd, _pop_chat_out
+    with _queue_lock:
+        n_ctrl = min(_CONTROL_SLOTS, len(_pending))
+        n_chat = min(_COMMAND_BATCH - n_ctrl, len(_chat_out))
+        batch = [pop() for _ in range(n_ctrl)]
+        batch += [pop_chat() for _ in range(n_chat)]
+    return _json_response(batch)
 
 
 @_app.route("/results", methods=["POST"])
@@ -93,7 +204,7 @@ def post_results():
     items = request.get_json(force=True, silent=True) or []
     if not isinstance(items, list):
         items = [items]
-    with _results_lock:
+    with _results_cond:
         for item in items:
             if isinstance(item, list):
                 try:
@@ -103,16 +214,25 @@ def post_results():
             if not isinstance(item, dict):
                 continue
             cmd_id = item.get("id")
-            if cmd_id and cmd_id in _result_events:
+            if cmd_id and cmd_id in _enqueue_time:
                 _results[cmd_id] = item
-                _result_events[cmd_id].set()
+        _results_cond.notify_all()
     return jsonify({"ack": len(items)})
 
 
 @_app.route("/context", methods=["POST"])
 def post_context():
-    """Scarpet pushes world state here (only changed values)."""
-    data = request.get_json(force=True, silent=True) or {}
+    """Scarpet pushes world state here (only changed values).
+
+    Accepts JSON, or msgpack when sent as application/msgpack.
+    """
+    if _msgpack is not None and request.mimetype == "application/msgpack":
+        try:
+            data = _msgpack.unpackb(request.get_data(), raw=False) or {}
+        except Exception:
+            data = {}
+    else:
+        data = _request_json({})
     with _context_lock:
         # Merge diff into latest context instead of clearing
         _latest_context.update(data)
@@ -122,7 +242,7 @@ def post_context():
 @_app.route("/context", methods=["GET"])
 def get_context_endpoint():
     """Agent polls latest context here."""
-    return jsonify(get_context())
+    return _json_response(get_context())
 
 
 @_app.route("/chat", methods=["POST"])
@@ -137,17 +257,19 @@ def post_chat():
 @_app.route("/chat", methods=["GET"])
 def get_chat():
     """Agent polls for player chat."""
-    messages = []
-    with _chat_lock:
-        while _chat_queue:
-            messages.append(_chat_queue.popleft())
-    return jsonify(messages)
+    return _json_response(_drain_chat())
+
+
+# Only the pending count changes, so the rest of the body is pre-encoded.
+_HEALTH_PREFIX = b'{"status":"ok","pending":'
+_HEALTH_SUFFIX = b'}'
 
 
 @_app.route("/health", methods=["GET"])
 def health():
     """Health check."""
-    return jsonify({"status": "ok", "pending": len(_pending)})
+    pending = str(len(_pending) + len(_chat_out)).encode()
+    return Response(_HEALTH_PREFIX + pending + _HEALTH_SUFFIX, mimetype="application/json")
 
 
 @_app.route("/inject", methods=["POST"])
@@ -159,18 +281,45 @@ def inject():
 
 
 def _start_http_server(host: str, port: int):
+    # Prefer waitress (listed in requirements.txt): HTTP/1.1 keep-alive so
+    # Scarpet reuses one connection per poll, and a real thread pool so a
+    # slow /context parse can't hold up the /commands poll. The werkzeug
+    # fallback closes the connection after every response.
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    if serve is not None:
+        logger.info(f"PetBot HTTP bridge listening on http://{host}:{port} (waitress)")
+        serve(
+            _app, host=host, port=port,
+            threads=8, connection_limit=200, cleanup_interval=30, channel_timeout=60,
+        )
+        return
+
     import werkzeug.serving
-    server = werkzeug.serving.make_server(host, port, _app)
-    logger.info(f"PetBot HTTP bridge listening on http://{host}:{port}")
+
+    server = werkzeug.serving.make_server(host, port, _app, threaded=True)
+    # Accepted sockets inherit these: no Nagle delay on the small JSON
+    # bodies, and dead peers get reaped by the OS.
+    server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    logger.info(f"PetBot HTTP bridge listening on http://{host}:{port} (werkzeug, no keep-alive)")
     server.serve_forever()
 
 
 class MinecraftBridge:
+    # Commands whose result nobody acts on: queue them and return at once
+    # instead of blocking the caller for a Scarpet round-trip.
+    _FIRE_AND_FORGET = frozenset({"stop", "sneak", "sprint", "look", "turn", "hotbar", "drop"})
+
     def __init__(self, host: str = "0.0.0.0", port: int = 5050, timeout: float = 5.0):
         self.host = host
         self.port = port
         self.timeout = timeout
         self._server_thread: Optional[threading.Thread] = None
+        self._janitor_thread: Optional[threading.Thread] = None
+        self._pipe = threading.local()  # per-thread step buffer for pipeline()
 
     def start(self):
         """Start HTTP server."""
@@ -184,6 +333,14 @@ class MinecraftBridge:
         )
         t.start()
         self._server_thread = t
+        if not (self._janitor_thread and self._janitor_thread.is_alive()):
+            self._janitor_thread = threading.Thread(
+                target=_janitor_loop,
+                args=(self.timeout * _JANITOR_MAX_AGE_FACTOR,),
+                daemon=True,
+                name="petbot-bridge-janitor",
+            )
+            self._janitor_thread.start()
         time.sleep(0.3)
         logger.info("MinecraftBridge started.")
 
@@ -193,25 +350,71 @@ class MinecraftBridge:
 
     def get_chat_messages(self) -> list:
         """Get player chat messages."""
-        with _chat_lock:
-            msgs = list(_chat_queue)
-            _chat_queue.clear()
-        return msgs
+        return _drain_chat()
 
     def _send(self, action: str, **kwargs) -> bool:
         """Send command and wait for result."""
-        cmd = {"action": action, **kwargs}
-        cmd_id = _enqueue(cmd)
+        # **kwargs is already a fresh dict owned by this call; use it as the
+        # command instead of copying it into a second one.
+        kwargs["action"] = action
+        steps = getattr(self._pipe, "steps", None)
+        if steps is not None:
+            steps.append(kwargs)
+            return True
+        if action in self._FIRE_AND_FORGET:
+            return self._send_nowait(kwargs)
+        cmd_id = _enqueue(kwargs)
         result = _wait_result(cmd_id, self.timeout)
         if result is None:
             logger.warning(f"Timeout waiting for result of: {action}")
             return False
+        # A _DROPPED result was already logged by _push_with_backpressure.
         return result.get("ok", False)
 
+    @contextmanager
+    def pipeline(self):
+        """
+        Buffer commands and ship them to Scarpet as one batch.
+
+        Inside the block, _send-based calls (move, hotbar, use, ...) return
+        True immediately; on exit the steps are sent as a single "batch"
+        command and executed in order, costing one poll round-trip instead
+        of one per command. Data calls (search_jei, execute_command) and
+        chat() are not buffered. Nested pipelines join the outer one.
+
+            with bridge.pipeline():
+                bridge.hotbar(3)
+                bridge.use()
+                bridge.look_rotation(90, 0)
+        """
+        if getattr(self._pipe, "steps", None) is not None:
+            yield self
+            return
+        self._pipe.steps = steps = []
+        try:
+            yield self
+        finally:
+            self._pipe.steps = None
+        if steps:
+            cmd_id = _enqueue({"action": "batch", "steps": steps})
+            result = _wait_result(cmd_id, self.timeout)
+            if result is None:
+                logger.warning(f"Timeout waiting for result of: batch ({len(steps)} steps)")
+            elif result is _DROPPED:
+                pass  # already logged by _push_with_backpressure
+            elif not result.get("ok", False):
+                logger.warning(f"Batch had failing steps: {result.get('results')}")
+
+    def _send_nowait(self, cmd: dict) -> bool:
+        """Queue a command without registering for (or waiting on) its result."""
+        cmd["id"] = _next_id()
+        _push_with_backpressure(cmd)
+        return True
+
     def _send_data(self, action: str, **kwargs) -> Optional[Any]:
         """Send command and get data result."""
-        cmd = {"action": action, **kwargs}
-        cmd_id = _enqueue(cmd)
+        kwargs["action"] = action
+        cmd_id = _enqueue(kwargs)
         result = _wait_result(cmd_id, self.timeout)
         return result.get("data") if result else None
 
@@ -283,9 +486,8 @@ class MinecraftBridge:
 
     def chat(self, message: str) -> bool:
         """Say something in chat."""
-        cmd_id = str(uuid.uuid4())[:8]
-        cmd = {"action": "chat", "message": message, "id": cmd_id}
-        _pending.append(cmd)
+        cmd = {"action": "chat", "message": message, "id": _next_id()}
+        _push_chat_out(cmd)
         return True
 
     # ── BLOCKS ────────────────────────────────────────────────────────────
@@ -333,4 +535,12 @@ class MinecraftBridge:
         return self.look_rotation(yaw, pitch)
 
     def click_block(self, x: int, y: int, z: int) -> bool:
-        return self.interact_block(x, y, z)
\ No newline at end of file
+        return self.interact_block(x, y, z)
+
+
+# The queues above are process-wide state: make a bare ``import minecraft_bridge``
+# (e.g. when run from inside minecraft/) resolve to this same module object
+# instead of loading a second copy with its own empty _pending deque.
+for _alias in ("minecraft.minecraft_bridge", "minecraft_bridge"):
+    sys.modules.setdefault(_alias, sys.modules[__name__])
+del _alias
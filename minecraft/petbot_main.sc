@@ -220,8 +220,9 @@ _dispatch(cmd) -> (
              if(action == 'place',       _do_place(cmd),
              if(action == 'interact',    _do_interact(cmd),
              if(action == 'raw_command', _do_raw(cmd),
+             if(action == 'batch',       _do_batch(cmd),
              {'ok' -> false, 'error' -> str('unknown action: %s', action)}
-             ))))))))))))))));
+             )))))))))))))))));
     {'id' -> id} + result
 );
 
@@ -336,4 +337,16 @@ _do_interact(cmd) -> (
 _do_raw(cmd) -> (
     result = run(cmd:'command');
     {'ok' -> true, 'data' -> str('%s', result)}
-);
\ No newline at end of file
+);
+
+// Pipelined steps from MinecraftBridge.pipeline(): run in order, one result back
+_do_batch(cmd) -> (
+    results = [];
+    ok = true;
+    for(cmd:'steps',
+        r = _dispatch(_);
+        results += [r];
+        if(!r:'ok', ok = false)
+    );
+    {'ok' -> ok, 'results' -> results}
+);
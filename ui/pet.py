@@ -1,12 +1,16 @@
 import random
+import re
 import time
 import os, sys
 import traceback
 import subprocess
 import threading
+import functools
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from PyQt5.QtCore import Qt, QTimer, QRect, QObject, pyqtSignal, QThread, QPoint
-from PyQt5.QtGui import QPainter, QPixmap, QPolygon, QBrush, QColor, QFont, QKeySequence
+from PyQt5.QtCore import Qt, QTimer, QRect, QObject, QEvent, pyqtSignal, QThread, QPoint
+from PyQt5.QtGui import QPainter, QPixmap, QImage, QPolygon, QBrush, QPen, QColor, QFont, QKeySequence
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QPushButton,
                              QShortcut, QHBoxLayout, QVBoxLayout, QFrame, QLineEdit)
 
@@ -25,6 +29,9 @@ import speech_recognition as sr
 # QThread.wait() uses milliseconds.
 THREAD_SHUTDOWN_WAIT_TIMEOUT_MS = 12000
 
+# Seconds without interaction before the pet curls up in its box / lies down.
+LONG_IDLE_SECONDS = 5 * 60
+
 if getattr(sys, 'frozen', False):
     # Running as a PyInstaller bundle — resources live in _MEIPASS
     BASE_DIR = sys._MEIPASS
@@ -47,6 +54,13 @@ def inject_process_path():
         os.environ["PATH"] = os.pathsep.join(extra + path_parts)
 
 
+def _load_sprite_image(path):
+    """Decode a sprite sheet into a QImage, or None if it's missing/unreadable."""
+    # A missing file just gives a null image, so no separate exists() stat
+    image = QImage(path)
+    return None if image.isNull() else image
+
+
 def should_run_tui() -> bool:
     try:
         from core.config import UI_MODE
@@ -234,6 +248,40 @@ class MinecraftBridgeThread(QThread):
 # WORKER THREAD
 # ============================================================================
 
+def _training_window():
+    try:
+        from core.config import TRAINING_WINDOW
+        return TRAINING_WINDOW
+    except Exception:
+        return 5000
+
+
+# Keyword -> category rules for PetWorker._simple_categorize, checked in order.
+_CATEGORY_RULES = (
+    (('chrome', 'firefox', 'edge', 'browser'), 'web-browsing'),
+    (('code', 'visual studio', 'pycharm', 'sublime', 'vim', 'notepad++'), 'coding'),
+    (('discord', 'slack', 'teams', 'zoom'), 'communication'),
+    (('spotify', 'music', 'vlc', 'media'), 'entertainment'),
+    (('game', 'steam', 'epic', 'minecraft'), 'gaming'),
+    (('word', 'excel', 'powerpoint', 'office'), 'productivity'),
+)
+
+# All keywords in one pass. The lookahead reports overlapping hits (e.g.
+# "steam" inside "msteams"), and the lowest rule index wins, same as above.
+_CATEGORY_RANK = {kw: i for i, (keywords, _) in enumerate(_CATEGORY_RULES) for kw in keywords}
+_CATEGORY_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in _CATEGORY_RANK) + "))", re.IGNORECASE
+)
+
+# An unchanged state is still re-sent this often (seconds) so the short-term
+# memory's recent-app window keeps seeing the current app
+_DATA_HEARTBEAT_S = 60
+
+# Bounds for PetWorker.category_cache and its batched DB writes
+_CATEGORY_CACHE_MAX   = 4096
+_CATEGORY_FLUSH_EVERY = 16
+
+
 class PetWorker(QObject):
     data_updated  = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
@@ -241,12 +289,15 @@ class PetWorker(QObject):
     def __init__(self, pet_only: bool = False):
         super().__init__()
         self.running  = False
+        self._stop    = threading.Event()  # set once by stop()
+        self._wake    = threading.Event()  # cuts the current poll sleep short
         self._pet_only = pet_only       # if True, skip tracking Minecraft windows
         self.memory       = Memory()
         self.tracker      = AppTracker()
         self.agent_bridge = AgentBridge()
         self.platform     = PlatformHelper()
-        self.category_cache = {}
+        self.category_cache = OrderedDict()   # app -> category, LRU order
+        self._pending_categories = []         # new categorisations not yet in the DB
 
     def start_worker(self):
         try:
@@ -254,13 +305,13 @@ class PetWorker(QObject):
             if parent_dir not in sys.path:
                 sys.path.insert(0, parent_dir)
 
-            self.memory  = Memory()
-            self.tracker = AppTracker()
-            self.category_cache = self.memory.get_all_categories()
+            # category_cache fills lazily: a miss does one primary-key lookup
+            # in get_category, so only apps actually seen this run are loaded.
 
-            history = self.memory.get_all_sessions()
-            if len(history) >= 10:
-                self.tracker.train_on_history(history)
+            # Cheap COUNT first; only pull the columns when there's enough to train on
+            if self.memory.get_session_count() >= 10:
+                history = self.memory.get_session_columns(limit=_training_window())
+                self.tracker.train_in_background(history)
 
             self.running = True
             print("✓ Worker initialized")
@@ -268,104 +319,161 @@ class PetWorker(QObject):
             self.error_occurred.emit(f"Worker init failed: {e}\n{traceback.format_exc()}")
 
     def run(self):
-        self.start_worker()
-        if not self.running:
-            return
+        try:
+            self.start_worker()
+            if self.running:
+                self._poll_loop()
+        finally:
+            # The loop was the only user of the shared DB connection; close it
+            # even when start_worker or the loop itself blew up.
+            try:
+                self._flush_categories()
+            except Exception as e:
+                print(f"Could not save categories: {e}")
+            self.memory.close()
 
+    def _poll_loop(self):
         last_retrain = 0
         error_count  = 0
+        stable_polls = 0    # consecutive polls with no app switch
+        prev_app, prev_category = None, 'unknown'   # last tick's foreground app
+        last_state, last_emit = None, 0.0            # last data_updated payload / time
 
         # Load config values for adaptive sleep
         try:
-            from core.config import POLL_INTERVAL_ACTIVE, POLL_INTERVAL_IDLE
+            from core.config import POLL_INTERVAL_ACTIVE, POLL_INTERVAL_IDLE, POLL_INTERVAL_MAX
             _poll_active = POLL_INTERVAL_ACTIVE
             _poll_idle   = POLL_INTERVAL_IDLE
+            _poll_max    = POLL_INTERVAL_MAX
         except Exception:
             _poll_active = 5.0
             _poll_idle   = 10.0
+            _poll_max    = 30.0
 
         while self.running:
             try:
+                self.tracker.collect_training()
                 app_name = self.platform.get_active_app()
                 if not app_name:
-                    time.sleep(_poll_idle)
+                    if self._sleep(_poll_idle):
+                        break
                     continue
 
                 # In pet_only mode skip Minecraft windows entirely
                 if self._pet_only and 'minecraft' in app_name.lower():
-                    time.sleep(_poll_idle)
+                    if self._sleep(_poll_idle):
+                        break
                     continue
 
                 session = self.tracker.start_tracking(app_name)
                 if session:
-                    category = self.get_category(session['app'])
+                    # The app that just ended was last tick's foreground app
+                    if session['app'] == prev_app:
+                        category = prev_category
+                    else:
+                        category = self.get_category(session['app'])
                     session['category'] = category
                     self.memory.save_session(session)
                     self.tracker.predict_anomalies(session, category)
 
-                current_category = self.get_category(app_name)
-                self.data_updated.emit({
-                    'surprised': self.tracker.surprised,
-                    'curious':   self.tracker.curious,
-                    'activeApp': app_name,
-                    'category':  current_category
-                })
+                if app_name != prev_app:
+                    prev_app, prev_category = app_name, self.get_category(app_name)
+                current_category = prev_category
+                state = (self.tracker.surprised, self.tracker.curious, app_name, current_category)
+                now = time.monotonic()
+                if state != last_state or now - last_emit >= _DATA_HEARTBEAT_S:
+                    last_state, last_emit = state, now
+                    self.data_updated.emit({
+                        'surprised': self.tracker.surprised,
+                        'curious':   self.tracker.curious,
+                        'activeApp': app_name,
+                        'category':  current_category
+                    })
 
                 if self.memory:
                     count = self.memory.get_session_count()
                     if count > 0 and count % 50 == 0 and count != last_retrain:
-                        history = self.memory.get_all_sessions()
-                        if self.tracker.train_on_history(history):
+                        # Fits on a worker thread; picked up by collect_training()
+                        self._flush_categories()
+                        history = self.memory.get_session_columns(limit=_training_window())
+                        if self.tracker.train_in_background(history):
                             last_retrain = count
 
                 error_count = 0
 
                 # Use a shorter sleep when the user is actively switching apps
                 # (app_name changed since last cycle is tracked by start_tracking).
-                sleep_interval = _poll_active if session else _poll_idle
-                time.sleep(sleep_interval)
+                # While the same app stays focused, back off: idle, 2x idle, ... up to the cap.
+                # Never poll faster than idle, even if the cap is configured below it.
+                if session:
+                    stable_polls = 0
+                    sleep_interval = _poll_active
+                else:
+                    stable_polls += 1
+                    sleep_interval = max(_poll_idle, min(_poll_max, _poll_idle * 2 ** min(stable_polls - 1, 3)))
+                if self._sleep(sleep_interval):
+                    break
 
             except Exception as e:
                 error_count += 1
                 if error_count >= 10:
-                    self.error_occurred.emit("Worker hit error limit")
+                    # Only the error that trips the limit gets a formatted traceback
+                    self.error_occurred.emit(
+                        f"Worker hit error limit; last error: {e!r}\n{traceback.format_exc()}")
+                    break
+                if self._sleep(1):
                     break
-                time.sleep(1)
 
     def get_category(self, app_name: str) -> str:
         if not app_name:
             return 'unknown'
-        if app_name in self.category_cache:
-            return self.category_cache[app_name]
+        category = self.category_cache.get(app_name)
+        if category is not None:
+            self.category_cache.move_to_end(app_name)
+            return category
         if self.memory:
             category = self.memory.get_category(app_name)
             if category != 'unknown':
-                self.category_cache[app_name] = category
+                self._cache_category(app_name, category)
                 return category
         category = self._simple_categorize(app_name)
-        self.category_cache[app_name] = category
+        self._cache_category(app_name, category)
         if self.memory:
-            self.memory.save_category(app_name, category)
+            self._pending_categories.append((app_name, category))
+            if len(self._pending_categories) >= _CATEGORY_FLUSH_EVERY:
+                self._flush_categories()
         return category
 
+    def _cache_category(self, app_name: str, category: str):
+        self.category_cache[app_name] = category
+        if len(self.category_cache) > _CATEGORY_CACHE_MAX:
+            self.category_cache.popitem(last=False)
+
+    def _flush_categories(self):
+        """Write buffered categorisations to the DB in one transaction."""
+        if self._pending_categories:
+            pending, self._pending_categories = self._pending_categories, []
+            self.memory.save_categories_bulk(pending)
+
     def _simple_categorize(self, app_name: str) -> str:
-        app_lower = app_name.lower()
-        if any(x in app_lower for x in ['chrome', 'firefox', 'edge', 'browser']):
-            return 'web-browsing'
-        elif any(x in app_lower for x in ['code', 'visual studio', 'pycharm', 'sublime', 'vim', 'notepad++']):
-            return 'coding'
-        elif any(x in app_lower for x in ['discord', 'slack', 'teams', 'zoom']):
-            return 'communication'
-        elif any(x in app_lower for x in ['spotify', 'music', 'vlc', 'media']):
-            return 'entertainment'
-        elif any(x in app_lower for x in ['game', 'steam', 'epic', 'minecraft']):
-            return 'gaming'
-        elif any(x in app_lower for x in ['word', 'excel', 'powerpoint', 'office']):
-            return 'productivity'
-        return 'unknown'
+        ranks = [_CATEGORY_RANK[m.group(1).lower()] for m in _CATEGORY_PATTERN.finditer(app_name)]
+        return _CATEGORY_RULES[min(ranks)][1] if ranks else 'unknown'
+
+    def _sleep(self, seconds) -> bool:
+        """Wait up to `seconds` or until woken; True means stop() was called."""
+        self._wake.wait(seconds)
+        self._wake.clear()
+        return self._stop.is_set()
+
+    def poke(self):
+        """Re-scan the foreground app now instead of after the current sleep."""
+        self._wake.set()
 
     def stop(self):
         self.running = False
+        self._stop.set()
+        self._wake.set()
+        self.tracker.shutdown()
 
 
 # ============================================================================
@@ -373,139 +481,227 @@ class PetWorker(QObject):
 # ============================================================================
 
 class STTWorker(QThread):
+    """Long-lived mic thread: sleeps until listen_once(), then runs one capture."""
     result_ready   = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._trigger = threading.Event()
+        self._cancel  = threading.Event()
+        self.busy     = False
+
+    def listen_once(self):
+        if not self.busy:
+            self._cancel.clear()
+            self._trigger.set()
+
+    def cancel(self):
+        """Drop the pending or in-progress capture's result, if any."""
+        self._cancel.set()
+
+    def shutdown(self):
+        self.requestInterruption()
+        self._cancel.set()
+        self._trigger.set()
+
+    def _cancelled(self):
+        return self._cancel.is_set() or self.isInterruptionRequested()
+
     def run(self):
+        # One recognizer for the thread's lifetime; the ambient-noise
+        # calibration (0.5 s of recording) only happens on the first capture.
         recognizer = sr.Recognizer()
-        try:
+        calibrated = False
+        while not self.isInterruptionRequested():
+            self._trigger.wait()
+            self._trigger.clear()
             if self.isInterruptionRequested():
-                return
+                break
+            if self._cancel.is_set():
+                continue
+            self.busy = True
+            try:
+                calibrated = self._capture(recognizer, calibrated)
+            finally:
+                self.busy = False
+
+    def _capture(self, recognizer, calibrated):
+        try:
             with sr.Microphone() as source:
-                recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                if not calibrated:
+                    recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                    calibrated = True
                 audio = recognizer.listen(source, timeout=5, phrase_time_limit=10)
-            if self.isInterruptionRequested():
-                return
+            if self._cancelled():
+                return calibrated
             text = recognizer.recognize_google(audio)
-            if text and not self.isInterruptionRequested():
+            if text and not self._cancelled():
                 self.result_ready.emit(text)
         except sr.WaitTimeoutError:
-            if not self.isInterruptionRequested():
+            if not self._cancelled():
                 self.error_occurred.emit("No speech detected")
         except sr.UnknownValueError:
-            if not self.isInterruptionRequested():
+            if not self._cancelled():
                 self.error_occurred.emit("Could not understand")
         except sr.RequestError as e:
-            if not self.isInterruptionRequested():
+            if not self._cancelled():
                 self.error_occurred.emit(f"Speech recognition error: {e}")
         except Exception as e:
-            if not self.isInterruptionRequested():
+            if not self._cancelled():
                 self.error_occurred.emit(f"STT error: {e}")
+        return calibrated
 
 
 # ============================================================================
 # MAIN GUI
 # ============================================================================
 
+# name -> (sheet path, frame width, frame height, frame count); built once
+_ANIM_DIR = os.path.join(BASE_DIR, "anim")
+_ANIMATIONS = {
+    "default":    (os.path.join(_ANIM_DIR, "idle.png"),        32, 32, 10),
+    "eat":        (os.path.join(_ANIM_DIR, "eat.png"),         32, 32, 15),
+    "boxDefault": (os.path.join(_ANIM_DIR, "boxDefault.png"),  32, 32,  4),
+    "boxSleep":   (os.path.join(_ANIM_DIR, "boxSleep.png"),    32, 32,  4),
+    "lie":        (os.path.join(_ANIM_DIR, "lie.png"),         32, 32, 12),
+    "sleep":      (os.path.join(_ANIM_DIR, "sleep.png"),       32, 32,  4),
+    "yawn":       (os.path.join(_ANIM_DIR, "yawn.png"),        32, 32,  8),
+    "angry":      (os.path.join(_ANIM_DIR, "angry2.png"),      32, 32,  9),
+    "angryalt":   (os.path.join(_ANIM_DIR, "angry1.png"),      32, 32,  4),
+}
+
+# Sheets turned into pixmaps at startup; the rest wait for first use
+_EAGER_ANIMATIONS = ("default", "eat")
+
+
+class PetAIProxy:
+    """GUI-side snapshot of the worker's latest pet state."""
+    __slots__ = ("worker", "surprised", "curious", "activeApp", "_last_category", "chatHistory")
+
+    def __init__(self, worker):
+        self.worker = worker
+        self.surprised = False
+        self.curious   = False
+        self.activeApp = "Unknown"
+        self._last_category = "unknown"
+        self.chatHistory = []
+
+    def categorize(self, app): return self._last_category
+
+
+# App-level so Qt parses it once instead of per bubble widget
+_CHAT_BUBBLE_QSS = """
+    QLabel#chatBubble {
+        background-color: white;
+        border: 2px solid black;
+        border-radius: 12px;
+        padding: 6px 8px;
+        color: black;
+        font-size: 10px;
+        font-family: Arial, sans-serif;
+    }
+"""
+
+
 class DesktopPet(QWidget):
     chat_signal = pyqtSignal(str)
 
     def __init__(self, start_minecraft_bridge: bool = False, pet_only: bool = False):
         super().__init__()
 
+        # Install the bubble style on the app once, however DesktopPet is
+        # launched; appended so an existing app stylesheet is kept.
+        app = QApplication.instance()
+        if app is not None and _CHAT_BUBBLE_QSS not in app.styleSheet():
+            app.setStyleSheet(app.styleSheet() + _CHAT_BUBBLE_QSS)
+
         # If pet_only=True the worker skips tracking Minecraft windows
         self._pet_only = pet_only
 
+        # ── Animations ────────────────────────────────────────────────────
+        self.animations = _ANIMATIONS
+
+        self.scale             = 3
+
+        # Decode the sheets on a small pool (QImage is fine off the GUI thread)
+        # while the bridge and worker thread start; only the QPixmap
+        # conversion below has to happen here.
+        sprite_pool = ThreadPoolExecutor(max_workers=4)
+        sprite_jobs = [sprite_pool.submit(_load_sprite_image, path)
+                       for path, _, _, _ in self.animations.values()]
+        sprite_pool.shutdown(wait=False)
+
         # ── Minecraft bridge (optional) ───────────────────────────────────
         self.mc_bridge_thread = None
         if start_minecraft_bridge:
             self._start_minecraft_bridge()
 
-        # ── Animations ────────────────────────────────────────────────────
-        self.animations = {
-            "default":    (os.path.join(BASE_DIR, "anim", "idle.png"),        32, 32, 10),
-            "eat":        (os.path.join(BASE_DIR, "anim", "eat.png"),         32, 32, 15),
-            "boxDefault": (os.path.join(BASE_DIR, "anim", "boxDefault.png"),  32, 32,  4),
-            "boxSleep":   (os.path.join(BASE_DIR, "anim", "boxSleep.png"),    32, 32,  4),
-            "lie":        (os.path.join(BASE_DIR, "anim", "lie.png"),         32, 32, 12),
-            "sleep":      (os.path.join(BASE_DIR, "anim", "sleep.png"),       32, 32,  4),
-            "yawn":       (os.path.join(BASE_DIR, "anim", "yawn.png"),        32, 32,  8),
-            "angry":      (os.path.join(BASE_DIR, "anim", "angry2.png"),      32, 32,  9),
-            "angryalt":   (os.path.join(BASE_DIR, "anim", "angry1.png"),      32, 32,  4),
-        }
+        # ── Worker thread ─────────────────────────────────────────────────
+        self.pet_worker    = PetWorker(pet_only=pet_only)
+        self.worker_thread = QThread()
+        self.pet_worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.pet_worker.run)
+        self._pending_pet_data = None
+        self.pet_worker.data_updated.connect(self._queue_pet_data)
+        self.pet_worker.error_occurred.connect(self.handle_worker_error)
+        self.worker_thread.start()
+        self.chat_signal.connect(self.showChat)
 
+        # ── Sprite pixmaps ────────────────────────────────────────────────
+        # Only the always-used sheets get pixmaps now; the idle/angry ones
+        # keep their decoded QImage until set_animation first needs them.
+        images = [job.result() for job in sprite_jobs]
         self.loaded_animations = {}
-        for name, (path, w, h, f) in self.animations.items():
-            if os.path.exists(path):
-                self.loaded_animations[name] = {
-                    "pixmap": QPixmap(path), "frame_width": w,
-                    "frame_height": h, "total_frames": f
+        for (name, (path, w, h, f)), image in zip(self.animations.items(), images):
+            if image is not None:
+                anim_data = {
+                    "image": image, "frame_width": w,
+                    "frame_height": h, "total_frames": f,
+                    "frames": None,
                 }
+                self.loaded_animations[name] = anim_data
+                if name in _EAGER_ANIMATIONS:
+                    self._animation_frames(anim_data)
 
         if not self.loaded_animations:
             placeholder = QPixmap(32, 32)
             placeholder.fill(QColor(100, 100, 100))
             self.loaded_animations["default"] = {
-                "pixmap": placeholder, "frame_width": 32,
-                "frame_height": 32, "total_frames": 1
+                "frame_width": 32,
+                "frame_height": 32, "total_frames": 1,
+                "frames": self._slice_frames(placeholder, 32, 32, 1),
             }
 
-        self.scale             = 3
         self.current_animation = "default"
         self.current_frame     = 0
+        self._bind_animation_frames()
         self.fps               = 8
 
-        # ── Worker thread ─────────────────────────────────────────────────
-        self.pet_worker    = PetWorker(pet_only=pet_only)
-        self.worker_thread = QThread()
-        self.pet_worker.moveToThread(self.worker_thread)
-        self.worker_thread.started.connect(self.pet_worker.run)
-        self.pet_worker.data_updated.connect(self.handle_pet_data)
-        self.pet_worker.error_occurred.connect(self.handle_worker_error)
-        self.worker_thread.start()
-        self.chat_signal.connect(self.showChat)
-
         # ── Messaging ─────────────────────────────────────────────────────
         self.setup_messaging()
 
-        class PetAIProxy:
-            def __init__(self, worker):
-                self.worker = worker
-                self._surprised = False
-                self._curious   = False
-                self._activeApp = "Unknown"
-                self._last_category = "unknown"
-                self.chatHistory = []
-            @property
-            def surprised(self): return self._surprised
-            @property
-            def curious(self):   return self._curious
-            @property
-            def activeApp(self): return self._activeApp
-            def categorize(self, app): return self._last_category
-
         self.pet_proxy = PetAIProxy(self.pet_worker)
 
         # ── Chat bubble ───────────────────────────────────────────────────
         self.chatBubble = QLabel("", self)
         self.chatBubble.setWordWrap(True)
-        self.chatBubble.setStyleSheet("""
-            QLabel {
-                background-color: white;
-                border: 2px solid black;
-                border-radius: 12px;
-                padding: 6px 8px;
-                color: black;
-                font-size: 10px;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        # Styled by _CHAT_BUBBLE_QSS on the QApplication (installed above)
+        self.chatBubble.setObjectName("chatBubble")
         self.chatBubble.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.chatBubble.hide()
+        self._bubble_brush = QBrush(Qt.white)
+        self._bubble_pen   = QPen(Qt.black)
+        self._pointer_poly = QPolygon([QPoint(), QPoint(), QPoint()])
+        self._pointer_rect = QRect()
+        # Fallback and repeated lines come back often; the bubble font is
+        # fixed by _CHAT_BUBBLE_QSS, so (text, width) is a complete key.
+        self.truncate_text = functools.lru_cache(maxsize=256)(self.truncate_text)
 
         self.chatHideTimer = QTimer(self)
         self.chatHideTimer.setSingleShot(True)
-        self.chatHideTimer.timeout.connect(self.chatBubble.hide)
+        self.chatHideTimer.setTimerType(Qt.VeryCoarseTimer)  # whole seconds is plenty
+        self.chatHideTimer.timeout.connect(self.hideChat)
 
         # ── Minecraft status indicator (small dot) ────────────────────────
         self.mc_indicator = QLabel("⛏", self)
@@ -567,7 +763,7 @@ class DesktopPet(QWidget):
             widget.hide()
 
         # ── Click tracking ────────────────────────────────────────────────
-        self.click_times = []
+        self.click_times = deque()
         self.clicked     = False
 
         # ── Window setup ──────────────────────────────────────────────────
@@ -583,30 +779,38 @@ class DesktopPet(QWidget):
 
         self.resize(self.sprite_width + self.chat_max_width + 30,
                     max(self.sprite_height, self.chat_max_height) + 30)
+        # Window size is fixed from here on, so the sprite rect is too
+        self._sprite_update_rect = self._sprite_rect()
+        self._sprite_origin = self._sprite_update_rect.topLeft()
+        self._watched_screen = None
+        self._refresh_screen()
+        app = QApplication.instance()
+        app.primaryScreenChanged.connect(self._refresh_screen)
+        app.screenAdded.connect(self._refresh_screen)
+        app.screenRemoved.connect(self._refresh_screen)
         self.move_to_bottom_right()
 
         self._update_overlay_positions()
 
         # ── Timers ────────────────────────────────────────────────────────
         self.animation_timer = QTimer(self)
+        # 8 fps doesn't need ms precision; let the OS batch the wakeups
+        self.animation_timer.setTimerType(Qt.CoarseTimer)
         self.animation_timer.timeout.connect(self.update_frame)
         self.animation_timer.start(1000 // self.fps)
 
-        self.idle_start_time = time.time()
+        self.idle_start_time = time.monotonic()
         self.yawn_triggered  = False
 
-        self.long_idle_timer = QTimer()
-        self.long_idle_timer.setSingleShot(True)
-        self.long_idle_timer.timeout.connect(self.handle_long_idle)
-        self.long_idle_timer.start(5 * 60 * 1000)
-
-        self.lie_sleep_timer = QTimer()
-        self.lie_sleep_timer.setSingleShot(True)
-        self.lie_sleep_timer.timeout.connect(self.start_sleep_from_lie)
-
-        self.box_sleep_timer = QTimer()
-        self.box_sleep_timer.setSingleShot(True)
-        self.box_sleep_timer.timeout.connect(self.start_box_sleep)
+        # Idle behaviours are deadlines checked on the animation tick rather
+        # than separate QTimers, so they cost no extra event-loop wakeups.
+        self._deadline_handlers = {
+            "long_idle": self.handle_long_idle,
+            "lie_sleep": self.start_sleep_from_lie,
+            "box_sleep": self.start_box_sleep,
+        }
+        self._deadlines = {}
+        self._schedule("long_idle", LONG_IDLE_SECONDS)
 
         self.stt_thread = None
         self._terminal_mode = os.environ.get("DPETML_TERMINAL_MODE", "0").lower() in ("1", "true", "yes")
@@ -673,8 +877,22 @@ class DesktopPet(QWidget):
 
     # ── Window helpers ────────────────────────────────────────────────────
 
+    def _refresh_screen(self, *_):
+        """Re-read the primary screen geometry; only screen changes invalidate it."""
+        screen = QApplication.primaryScreen()
+        # Follow resolution changes on whichever screen is currently primary
+        if screen is not self._watched_screen:
+            if self._watched_screen is not None:
+                try:
+                    self._watched_screen.geometryChanged.disconnect(self._refresh_screen)
+                except (TypeError, RuntimeError):
+                    pass
+            screen.geometryChanged.connect(self._refresh_screen)
+            self._watched_screen = screen
+        self._screen_geom = screen.geometry()
+
     def move_to_bottom_right(self):
-        screen = QApplication.primaryScreen().geometry()
+        screen = self._screen_geom
         self.move(screen.width() - self.width() - 10,
                   screen.height() - self.height() - 50)
 
@@ -715,20 +933,38 @@ class DesktopPet(QWidget):
 
     # ── Animation system ──────────────────────────────────────────────────
 
+    def _schedule(self, key, delay_s, restart=True):
+        """Fire the handler for key after delay_s seconds (on the animation tick)."""
+        if restart or key not in self._deadlines:
+            self._deadlines[key] = time.monotonic() + delay_s
+
+    def _run_due_deadlines(self):
+        now = time.monotonic()
+        for key, due in list(self._deadlines.items()):
+            # A handler fired earlier in this pass may have cancelled or
+            # rescheduled this key already.
+            if now >= due and self._deadlines.get(key) == due:
+                del self._deadlines[key]
+                self._deadline_handlers[key]()
+
     def update_frame(self):
-        if self.current_animation not in self.loaded_animations:
+        if self._deadlines:
+            self._run_due_deadlines()
+        if not self._cur_total:
             return
-        anim_data = self.loaded_animations[self.current_animation]
-        self.current_frame = (self.current_frame + 1) % anim_data["total_frames"]
-        self.update()
-        if self.current_frame == anim_data["total_frames"] - 1:
+        self.current_frame = (self.current_frame + 1) % self._cur_total
+        # Only the sprite changes between frames, and single-frame sheets
+        # (e.g. the placeholder) never change at all
+        if self._cur_total > 1:
+            self.update(self._sprite_update_rect)
+        if self.current_frame == self._cur_total - 1:
             self.on_animation_end()
 
     def on_animation_end(self):
         if self.current_animation == "boxDefault":
-            self.box_sleep_timer.start(1000)
+            self._schedule("box_sleep", 1.0, restart=False)
         elif self.current_animation == "lie":
-            self.lie_sleep_timer.start(30000)
+            self._schedule("lie_sleep", 30.0, restart=False)
         elif self.current_animation in ("angry", "angryalt"):
             self.set_animation("default")
             self.clicked = False
@@ -743,40 +979,61 @@ class DesktopPet(QWidget):
         if name != self.current_animation:
             self.current_animation = name
             self.current_frame = 0
-            self.update()
+            self._bind_animation_frames()
+            # Sleep transitions belong to the animation we're leaving
+            self._deadlines.pop("lie_sleep", None)
+            self._deadlines.pop("box_sleep", None)
+            self.update(self._sprite_update_rect)
+
+    def _bind_animation_frames(self):
+        """Cache the current animation's frame list so ticks and paints skip the dict lookups."""
+        anim_data = self.loaded_animations.get(self.current_animation)
+        self._cur_frames = self._animation_frames(anim_data) if anim_data else []
+        self._cur_total  = len(self._cur_frames)
+
+    def _animation_frames(self, anim_data):
+        """Return an animation's frames, slicing its sheet on first use."""
+        if anim_data["frames"] is None:
+            pixmap = QPixmap.fromImage(anim_data.pop("image"))
+            anim_data["frames"] = self._slice_frames(
+                pixmap, anim_data["frame_width"],
+                anim_data["frame_height"], anim_data["total_frames"])
+        return anim_data["frames"]
+
+    def _slice_frames(self, pixmap, w, h, total_frames):
+        """Cut a sprite sheet into per-frame pixmaps, pre-scaled for drawing."""
+        return [
+            pixmap.copy(QRect(i * w, 0, w, h)).scaled(
+                w * self.scale, h * self.scale,
+                Qt.KeepAspectRatio, Qt.FastTransformation
+            )
+            for i in range(total_frames)
+        ]
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        if self.current_animation not in self.loaded_animations:
-            return
-        anim_data = self.loaded_animations[self.current_animation]
-        frame_rect = QRect(
-            self.current_frame * anim_data["frame_width"], 0,
-            anim_data["frame_width"], anim_data["frame_height"]
-        )
-        frame = anim_data["pixmap"].copy(frame_rect)
-        scaled_frame = frame.scaled(
-            anim_data["frame_width"] * self.scale,
-            anim_data["frame_height"] * self.scale,
-            Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        sprite_rect = self._sprite_rect()
-        painter.drawPixmap(sprite_rect.x(), sprite_rect.y(), scaled_frame)
-        if self.chatBubble.isVisible():
+        dirty = event.rect()
+        # Pointer-only repaints (bubble shown/hidden) don't need the sprite
+        if self._cur_frames and dirty.intersects(self._sprite_update_rect):
+            painter.drawPixmap(self._sprite_origin, self._cur_frames[self.current_frame])
+        if self.chatBubble.isVisible() and dirty.intersects(self._pointer_rect):
             self.draw_speech_pointer(painter)
 
-    def draw_speech_pointer(self, painter):
+    def _place_speech_pointer(self):
+        """Move the pointer triangle under the bubble; called when the bubble moves."""
         bubble_rect    = self.chatBubble.geometry()
         pointer_start_x = bubble_rect.right() - 15
         pointer_start_y = bubble_rect.bottom()
-        triangle = QPolygon([
-            QPoint(pointer_start_x,      pointer_start_y),
-            QPoint(pointer_start_x + 15, pointer_start_y + 12),
-            QPoint(pointer_start_x - 5,  pointer_start_y + 8)
-        ])
-        painter.setBrush(QBrush(Qt.white))
-        painter.setPen(Qt.black)
-        painter.drawPolygon(triangle)
+        self._pointer_poly.setPoint(0, pointer_start_x,      pointer_start_y)
+        self._pointer_poly.setPoint(1, pointer_start_x + 15, pointer_start_y + 12)
+        self._pointer_poly.setPoint(2, pointer_start_x - 5,  pointer_start_y + 8)
+        # Pad for the pen's stroke when this is used as a dirty rect
+        self._pointer_rect = self._pointer_poly.boundingRect().adjusted(-2, -2, 2, 2)
+
+    def draw_speech_pointer(self, painter):
+        painter.setBrush(self._bubble_brush)
+        painter.setPen(self._bubble_pen)
+        painter.drawPolygon(self._pointer_poly)
 
     # ── Chat system ───────────────────────────────────────────────────────
 
@@ -801,9 +1058,8 @@ class DesktopPet(QWidget):
                 else:
                     shortened_words.append(word)
             text = " ".join(shortened_words)
-        while font_metrics.boundingRect(text + "...").width() > max_width and len(text) > 3:
-            text = text[:-1]
-        return text + "..." if len(text) > 3 else text
+        # Qt finds the cut point natively instead of one boundingRect per char
+        return font_metrics.elidedText(text, Qt.ElideRight, max_width)
 
     def showChat(self, text, duration=4000):
         print(f"💬 Chat: {text}")
@@ -817,11 +1073,19 @@ class DesktopPet(QWidget):
         bubble_x = max(20, sprite_rect.left() - self.chatBubble.width() - 18)
         bubble_y = max(12, sprite_rect.top() - max(0, self.chatBubble.height() // 3))
         self.chatBubble.move(bubble_x, bubble_y)
+        old_pointer = self._pointer_rect
+        self._place_speech_pointer()
         self.chatBubble.raise_()
         self.chatBubble.show()
-        self.update()
+        # The bubble label repaints itself; only the pointer is ours to redraw
+        self.update(old_pointer.united(self._pointer_rect))
         self.chatHideTimer.start(duration)
 
+    def hideChat(self):
+        self.chatBubble.hide()
+        # Frame ticks only repaint the sprite, so clear the pointer here
+        self.update(self._pointer_rect)
+
     # ── Idle behaviour ────────────────────────────────────────────────────
 
     def handle_long_idle(self):
@@ -840,16 +1104,17 @@ class DesktopPet(QWidget):
             self.set_animation("boxSleep")
 
     def reset_idle(self):
-        self.idle_start_time = time.time()
+        self.idle_start_time = time.monotonic()
         self.yawn_triggered  = False
-        self.long_idle_timer.start(5 * 60 * 1000)
+        self._schedule("long_idle", LONG_IDLE_SECONDS)
 
     # ── Input handling ────────────────────────────────────────────────────
 
     def mousePressEvent(self, event):
-        now = time.time()
+        now = time.monotonic()
         self.click_times.append(now)
-        self.click_times = [t for t in self.click_times if now - t <= 2]
+        while now - self.click_times[0] > 2:
+            self.click_times.popleft()
 
         if len(self.click_times) >= 5:
             angry_options = [a for a in ["angry", "angryalt"] if a in self.loaded_animations]
@@ -882,20 +1147,23 @@ class DesktopPet(QWidget):
         self.process_user_command(text)
 
     def start_stt(self):
-        if self.stt_thread and self.stt_thread.isRunning():
-            return
-        self.stt_thread = STTWorker()
-        self.stt_thread.result_ready.connect(self.handle_stt_result)
-        self.stt_thread.error_occurred.connect(self.handle_stt_error)
-        self.stt_thread.start()
+        # Created on first use and kept; later clicks just wake it
+        if self.stt_thread is None:
+            self.stt_thread = STTWorker()
+            self.stt_thread.result_ready.connect(self.handle_stt_result)
+            self.stt_thread.error_occurred.connect(self.handle_stt_error)
+            self.stt_thread.start()
+        self.stt_thread.listen_once()
 
     def stop_stt(self):
-        if self.stt_thread and self.stt_thread.isRunning():
-            self.stt_thread.requestInterruption()
-            if not self.stt_thread.wait(200):
-                print("STT stop requested; waiting up to 200ms for the current listen cycle to finish.")
+        if self.stt_thread:
+            self.stt_thread.cancel()
 
     def process_user_command(self, text: str):
+        # The user is back at the pet; the worker may be deep in its idle
+        # backoff, so re-scan the foreground app now rather than up to
+        # POLL_INTERVAL_MAX later.
+        self.pet_worker.poke()
         try:
             handled, response = self.plugin_manager.handle_command(text)
         except Exception:
@@ -931,20 +1199,33 @@ class DesktopPet(QWidget):
 
     # ── Thread communication ──────────────────────────────────────────────
 
+    def _queue_pet_data(self, data):
+        # If the worker gets ahead of the GUI, several updates can queue up;
+        # only the newest one matters, so apply just that.
+        first = self._pending_pet_data is None
+        self._pending_pet_data = data
+        if first:
+            QTimer.singleShot(50, self._flush_pet_data)
+
+    def _flush_pet_data(self):
+        data, self._pending_pet_data = self._pending_pet_data, None
+        if data is not None:
+            self.handle_pet_data(data)
+
     def handle_pet_data(self, data):
-        self.pet_proxy._surprised    = data.get('surprised', False)
-        self.pet_proxy._curious      = data.get('curious',   False)
-        self.pet_proxy._activeApp    = data.get('activeApp', 'Unknown')
+        self.pet_proxy.surprised     = data.get('surprised', False)
+        self.pet_proxy.curious       = data.get('curious',   False)
+        self.pet_proxy.activeApp     = data.get('activeApp', 'Unknown')
         self.pet_proxy._last_category = data.get('category', 'unknown')
 
         if self.agent_bridge and self.agent_bridge.memory:
             try:
-                self.agent_bridge.memory.add("app_activity", {
-                    "app":       data.get('activeApp', 'Unknown'),
-                    "category":  data.get('category',  'unknown'),
-                    "surprised": data.get('surprised', False),
-                    "curious":   data.get('curious',   False)
-                })
+                self.agent_bridge.memory.add_app_activity(
+                    data.get('activeApp', 'Unknown'),
+                    data.get('category',  'unknown'),
+                    surprised=data.get('surprised', False),
+                    curious=data.get('curious',   False),
+                )
                 if hasattr(self.agent_bridge, 'messenger'):
                     m = self.agent_bridge.messenger
                     m.pet._activeApp      = data.get('activeApp', 'Unknown')
@@ -967,14 +1248,34 @@ class DesktopPet(QWidget):
             self._set_command_controls_visible(False)
             self.hide()
 
+    # ── Pause animation while not on screen ─────────────────────────────
+
+    def _sync_animation_timer(self):
+        if self.isVisible() and not self.isMinimized():
+            if not self.animation_timer.isActive():
+                self.animation_timer.start(1000 // self.fps)
+        else:
+            self.animation_timer.stop()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_animation_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_animation_timer()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._sync_animation_timer()
+
     # ── Cleanup ───────────────────────────────────────────────────────────
 
     def closeEvent(self, event):
         print("🛑 Shutting down...")
         self.animation_timer.stop()
-        self.long_idle_timer.stop()
-        self.lie_sleep_timer.stop()
-        self.box_sleep_timer.stop()
+        self._deadlines.clear()
         self.chatHideTimer.stop()
 
         if self.agent_bridge:
@@ -984,7 +1285,7 @@ class DesktopPet(QWidget):
                 print(f"Error stopping agent bridge: {e}")
 
         if self.stt_thread and self.stt_thread.isRunning():
-            self.stt_thread.requestInterruption()
+            self.stt_thread.shutdown()
             if not self.stt_thread.wait(THREAD_SHUTDOWN_WAIT_TIMEOUT_MS):
                 print("⚠ STT worker did not stop before shutdown; leaving without force terminate.")
 
@@ -1008,6 +1309,10 @@ class DesktopPet(QWidget):
 # GLOBAL KILL HOTKEY  —  works even when a game has focus
 # ============================================================================
 
+class _KillEmitter(QObject):
+    triggered = pyqtSignal()
+
+
 def register_global_kill_hotkey(app: QApplication):
     """
     Registers Ctrl+Shift+F4 as a system-wide hotkey using the 'keyboard' lib.
@@ -1018,10 +1323,15 @@ def register_global_kill_hotkey(app: QApplication):
         print("⚠ Global kill hotkey disabled — install 'keyboard' and/or run with administrator privileges on Windows. The pet will keep working without it.")
         return
 
+    # keyboard's callback runs on its own (non-Qt) thread, where a QTimer
+    # would never fire; a queued signal to an object owned by the GUI thread
+    # is the safe hop. Kept on app so it isn't garbage-collected.
+    app._kill_emitter = _KillEmitter()
+    app._kill_emitter.triggered.connect(app.quit, Qt.QueuedConnection)
+
     def _on_hotkey():
         print("🔑 Kill hotkey triggered")
-        # keyboard callback runs on a background thread; use QTimer to hop to Qt thread
-        QTimer.singleShot(0, app.quit)
+        app._kill_emitter.triggered.emit()
 
     try:
         _keyboard.add_hotkey("ctrl+shift+f4", _on_hotkey, suppress=True)